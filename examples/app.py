@@ -2,6 +2,8 @@ import click
 
 from guigaga import gui
 
+COMPLEMENT = str.maketrans("ACGTNacgtn", "TGCANTGCAN")
+
 
 @gui(name="Bioinformatics tools")
 @click.group()
@@ -19,9 +21,7 @@ def reverse_complement(sequence):
     """
     This script computes the reverse complement of a DNA sequence.
     """
-    complement = {"A": "T", "T": "A", "C": "G", "G": "C", "N": "N"}
-    sequence = sequence.upper()
-    result = "".join(complement[base] for base in reversed(sequence))
+    result = sequence.translate(COMPLEMENT)[::-1]
     click.echo(result)
 
 @home.command()
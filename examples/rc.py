@@ -2,15 +2,15 @@ import click
 
 import guigaga
 
+COMPLEMENT = str.maketrans("ACGTNacgtn", "TGCANTGCAN")
+
 
 @guigaga.gui()
 @click.command()
 @click.argument("sequence",  type=str)
 def reverse_complement(sequence):
     """This script computes the reverse complement of a DNA sequence."""
-    complement = {"A": "T", "T": "A", "C": "G", "G": "C", "N": "N"}
-    sequence = sequence.upper()
-    result = "".join(complement[base] for base in reversed(sequence))
+    result = sequence.translate(COMPLEMENT)[::-1]
     click.echo(result)
 
 if __name__ == "__main__":
@@ -1,19 +1,30 @@
-from typing import Callable, Optional
+from types import MappingProxyType
+from typing import Callable, Mapping, Optional
 
+# Mapping of CLI option names to launch_kwargs keys
+CLI_MAPPINGS = MappingProxyType(
+    {
+        "share": "share",
+        "host": "server_name",
+        "port": "server_port",
+    }
+)
 
-def update_launch_kwargs_from_cli(ctx, launch_kwargs, cli_mappings):
+
+def update_launch_kwargs_from_cli(ctx, launch_kwargs, cli_mappings: Mapping[str, str] = CLI_MAPPINGS):
     """
     Update launch_kwargs with CLI options that differ from their defaults.
 
     Args:
         ctx: Click context object containing the command parameters and options.
         launch_kwargs: Dictionary to update with CLI-specified values.
-        cli_mappings: Dictionary mapping CLI option names to their corresponding launch_kwargs keys.
+        cli_mappings: Mapping of CLI option names to their corresponding launch_kwargs keys. Defaults to CLI_MAPPINGS.
     """
+    params = ctx.params
     for param in ctx.command.params:
         param_name = param.name
-        if param_name in cli_mappings and ctx.params[param_name] != param.default:
-            launch_kwargs[cli_mappings[param_name]] = ctx.params[param_name]
+        if param_name in cli_mappings and params[param_name] != param.default:
+            launch_kwargs[cli_mappings[param_name]] = params[param_name]
 
 
 
@@ -28,6 +39,8 @@ def gui(
     launch_kwargs: Optional[dict] = None,
     queue_kwargs: Optional[dict] = None,
     catch_errors: bool = True,
+    stream_throttle_ms: int = 100,
+    lazy_tabs: bool = False,
 ) -> Callable:
     """
     Creates a decorator for a click command or group to add a GUI interface.
@@ -42,6 +55,8 @@ def gui(
       launch_kwargs (Optional[dict]): Additional keyword arguments to pass to the launch method. Defaults to None.
       queue_kwargs (Optional[dict]): Additional keyword arguments to pass to the queue method. Defaults to None.
       catch_errors (bool): Whether to catch and display errors in the GUI. Defaults to True.
+      stream_throttle_ms (int): The minimum time in milliseconds between log updates sent to the GUI. Defaults to 100.
+      lazy_tabs (bool): Whether to build subcommand tabs only when they are first opened. Defaults to False.
 
     Returns:
       Callable: A decorator that can be used to add a GUI to a click command or group.
@@ -97,35 +112,30 @@ def gui(
                 port (int): The port number to use for sharing the GUI.
 
             Side Effects:
-                Modifies the launch_kwargs dictionary based on the CLI inputs.
-                Launches the GUI.
+                Launches the GUI with a copy of launch_kwargs updated from the CLI inputs.
 
             Notes:
                 This function is decorated with click.pass_context, and click.option for "share", "host", and "port".
             """
             from guigaga.guigaga import GUIGAGA
 
-            # Mapping of CLI option names to launch_kwargs keys
-            cli_mappings = {
-                "share": "share",
-                "host": "server_name",
-                "port": "server_port",
-            }
-
-            # Update launch_kwargs based on CLI inputs
-            update_launch_kwargs_from_cli(ctx, launch_kwargs, cli_mappings)
+            # Update a copy of launch_kwargs based on CLI inputs so repeated invocations don't accumulate state
+            cli_launch_kwargs = dict(launch_kwargs)
+            update_launch_kwargs_from_cli(ctx, cli_launch_kwargs)
 
             # Build the interface using GUIGAGA
             GUIGAGA(
                 app,
                 app_name=name,
                 command_name=command_name,
-                click_context=click.get_current_context(),
+                click_context=ctx,
                 theme=theme,
                 hide_not_required=hide_not_required,
                 allow_file_download=allow_file_download,
                 catch_errors=catch_errors,
-            ).launch(queue_kwargs=queue_kwargs, launch_kwargs=launch_kwargs)
+                stream_throttle_ms=stream_throttle_ms,
+                lazy_tabs=lazy_tabs,
+            ).launch(queue_kwargs=queue_kwargs, launch_kwargs=cli_launch_kwargs)
 
         # Handle case where app is a click.Group or a click.Command
         if isinstance(app, click.Group):
@@ -1,7 +1,11 @@
+import asyncio
 import uuid
+import warnings
 from datetime import datetime
+from functools import lru_cache
 from importlib import metadata
-from typing import Optional
+from types import MappingProxyType
+from typing import Callable, Optional
 
 import click
 import gradio as gr
@@ -10,13 +14,154 @@ from gradio import Theme as GradioTheme
 
 from guigaga.introspect import ArgumentSchema, CommandSchema, OptionSchema, introspect_click_app
 from guigaga.logger import Logger
-from guigaga.types import InputParamType, OutputParamType
+
+# Formats used for datetime parameters that don't specify their own
+DEFAULT_DATETIME_FORMATS = ("%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S")
+
+# Command schemas keyed by click command. This is a plain dict on purpose: each schema references its command's
+# callback (and through it the command), so entries would never be collected from a weak cache either.
+_command_schemas_cache: "dict[click.BaseCommand, dict]" = {}
+
+
+def get_command_schemas(cli: click.BaseCommand) -> dict:
+    """
+    Gets the command schemas for the given command line interface, introspecting it only once.
+
+    Args:
+      cli (click.BaseCommand): The command line interface to introspect.
+
+    Returns:
+      dict: The command schemas returned by introspect_click_app.
+    """
+    try:
+        return _command_schemas_cache[cli]
+    except KeyError:
+        command_schemas = _command_schemas_cache[cli] = introspect_click_app(cli)
+        return command_schemas
+
+
+@lru_cache(maxsize=None)
+def get_package_version(name: str) -> str | None:
+    """
+    Gets the installed version of the given package.
+
+    Args:
+      name (str): The name of the package.
+
+    Returns:
+      str | None: The version of the package, or None if it could not be found.
+    """
+    try:
+        return metadata.version(name)
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=None)
+def get_theme(name: str) -> GradioTheme | str:
+    """
+    Resolves a Hugging Face Hub theme name to a Gradio theme once, so it isn't downloaded again for every block.
+
+    Args:
+      name (str): The name of a built-in theme or a theme on the Hugging Face Hub.
+
+    Returns:
+      GradioTheme | str: The name if it is a built-in theme, otherwise the theme loaded from the Hub or the default
+        theme if it could not be loaded.
+    """
+    # Built-in themes are cheap for gradio to resolve, so pass their names through
+    theme_class = getattr(gr.themes, name.capitalize(), None)
+    if isinstance(theme_class, type) and issubclass(theme_class, GradioTheme):
+        return name
+    try:
+        return GradioTheme.from_hub(name)
+    except Exception as error:
+        warnings.warn(f"Cannot load theme {name!r}, using the default theme instead: {error}", stacklevel=2)
+        return gr.themes.Default()
+
+
+def _build_text(schema, label, default, help_text):  # noqa: ARG001
+    """Builds a textbox for a text (or unknown) parameter type."""
+    return gr.Textbox(value=default, label=label, info=help_text)
+
+
+def _build_integer(schema, label, default, help_text):  # noqa: ARG001
+    """Builds a number input for an integer parameter type."""
+    return gr.Number(default, label=label, precision=0, info=help_text)
+
+
+def _build_float(schema, label, default, help_text):  # noqa: ARG001
+    """Builds a number input for a float parameter type."""
+    return gr.Number(default, label=label, info=help_text)
+
+
+def _build_boolean(schema, label, default, help_text):  # noqa: ARG001
+    """Builds a checkbox for a boolean parameter type."""
+    return gr.Checkbox(default == "true", label=label, info=help_text)
+
+
+def _build_uuid(schema, label, default, help_text):  # noqa: ARG001
+    """Builds a textbox prefilled with a new UUID for a uuid parameter type."""
+    uuid_val = str(uuid.uuid4()) if default is None else default
+    return gr.Textbox(uuid_val, label=label, info=help_text)
+
+
+def _build_file(schema, label, default, help_text):  # noqa: ARG001
+    """Builds a file input for a filename or path parameter type."""
+    return gr.File(label=label, value=default)
+
+
+def _build_choice(schema, label, default, help_text):
+    """Builds a dropdown for a choice parameter type."""
+    choices = schema.type.choices
+    return gr.Dropdown(choices, value=default, label=label, info=help_text)
+
+
+def _build_integer_range(schema, label, default, help_text):
+    """Builds a slider for an integer range parameter type."""
+    min_val = schema.type.min if schema.type.min is not None else 0
+    max_val = schema.type.max if schema.type.max is not None else 100
+    return gr.Slider(minimum=min_val, maximum=max_val, step=1, value=default, label=label, info=help_text)
+
+
+def _build_float_range(schema, label, default, help_text):
+    """Builds a slider for a float range parameter type."""
+    min_val = schema.type.min if schema.type.min is not None else 0.0
+    max_val = schema.type.max if schema.type.max is not None else 1.0
+    return gr.Slider(minimum=min_val, maximum=max_val, value=default, label=label, step=0.01, info=help_text)
+
+
+def _build_datetime(schema, label, default, help_text):
+    """Builds a datetime input for a datetime parameter type."""
+    if default is not None:
+        datetime_val = default
+    else:
+        formats = schema.type.formats if schema.type.formats else DEFAULT_DATETIME_FORMATS
+        datetime_val = datetime.now().strftime(formats[0])  # noqa: DTZ005
+    return gr.DateTime(value=datetime_val, label=label, info=help_text)
 
 
 class GUIGAGA:
     """
     A class to build a graphical user interface for a given command line interface.
     """
+    # Maps click parameter type names to the functions that build their components
+    _BUILDERS = MappingProxyType(
+        {
+            "text": _build_text,
+            "integer": _build_integer,
+            "float": _build_float,
+            "boolean": _build_boolean,
+            "uuid": _build_uuid,
+            "filename": _build_file,
+            "path": _build_file,
+            "choice": _build_choice,
+            "integer range": _build_integer_range,
+            "float range": _build_float_range,
+            "datetime": _build_datetime,
+        }
+    )
+
     def __init__(
         self,
         cli: click.Group | click.Command,
@@ -28,6 +173,8 @@ class GUIGAGA:
         hide_not_required: bool = False,
         allow_file_download: bool = False,
         catch_errors: bool = True,
+        stream_throttle_ms: int = 100,
+        lazy_tabs: bool = False,
     ):
         """
         Initializes the GUIGAGA with the given parameters.
@@ -41,26 +188,29 @@ class GUIGAGA:
           hide_not_required (bool): Whether to hide not required options. Defaults to False.
           allow_file_download (bool): Whether to allow file download. Defaults to False.
           catch_errors (bool): Whether to catch errors. Defaults to True.
+          stream_throttle_ms (int): The minimum time in milliseconds between log updates. Defaults to 100.
+          lazy_tabs (bool): Whether to build subcommand tabs only when they are first selected. Defaults to False.
 
         Side Effects:
           - Initializes various instance variables.
-          - Calls introspect_click_app to get the command schemas.
+          - Calls get_command_schemas to get the (cached) command schemas.
           - Calls traverse_command_tree to create the interface.
         """
         self.cli = cli
         self.app_name = app_name if app_name else self.cli.name.upper()
         self.command_name = command_name
-        self.theme = theme
+        self.theme = get_theme(theme) if isinstance(theme, str) else theme
         self.hide_not_required = hide_not_required
         self.allow_file_download = allow_file_download
         self.catch_errors = catch_errors
-        self.command_schemas = introspect_click_app(cli)
+        self.stream_throttle_ms = stream_throttle_ms
+        self.lazy_tabs = lazy_tabs
+        self.logger = Logger()
+        self.command_schemas = get_command_schemas(cli)
         self.blocks = []
         self.click_context = click_context
-        try:
-            self.version = metadata.version(self.click_app_name)
-        except Exception:
-            self.version = None
+        self.version = get_package_version(self.cli.name)
+        self.title = f"{self.app_name} (v{self.version})" if self.version else self.app_name
         # Traverse the command tree and create the interface
         if isinstance(self.command_schemas, dict) and "root" in self.command_schemas:
             schema_tree = self.command_schemas["root"]
@@ -87,21 +237,27 @@ class GUIGAGA:
     def traverse_command_tree(self, schema: CommandSchema):
         """Recursively traverse the command tree and create a tabbed interface for each nested command group"""
         tab_blocks = []
-        # If the current schema has no subcommands, create a block
+        # If the current schema has no subcommands, create a block with the app title (only the top level is a leaf)
         if not schema.subcommands:
-            block = self.create_block(schema)
+            block = self.create_block(schema, title=self.title)
             tab_blocks.append(block)
         else:
+            subcommands = [
+                subcommand for subcommand in schema.subcommands.values() if subcommand.name != self.command_name
+            ]
+            # Defer building each tab until it is first opened
+            if self.lazy_tabs and len(subcommands) > 1:
+                return self.create_lazy_tabs(schema, subcommands)
+            # A root group with a single command is shown without tabs, so that command's block gets the app title
+            title = self.title if schema.name == "root" and len(subcommands) == 1 else None
             # Process all subcommands of the current schema
-            for subcommand in schema.subcommands.values():
-                if subcommand.name == self.command_name:
-                    continue
+            for subcommand in subcommands:
                 # Recursively traverse subcommands and collect blocks
                 if subcommand.subcommands:  # Check if it's a group with nested commands
                     sub_interface = self.traverse_command_tree(subcommand)
                     tab_blocks.append((subcommand.name, sub_interface))
                 else:
-                    block = self.create_block(subcommand)
+                    block = self.create_block(subcommand, title=title)
                     tab_blocks.append(block)
 
         # If there are multiple blocks, create a TabbedInterface
@@ -110,8 +266,7 @@ class GUIGAGA:
             interface_list = [block for _, block in tab_blocks]
             if schema.name == "root":
                 with gr.Blocks(theme=self.theme, analytics_enabled=False, title=self.app_name) as block:
-                    version = f" (v{self.version})" if self.version else ""
-                    gr.Markdown(f"""# {self.app_name}{version}\n{schema.docstring}""")
+                    gr.Markdown(f"""# {self.title}\n{schema.docstring}""")
                     # gr.Markdown(f"{schema.docstring}")
                     TabbedInterface(interface_list, tab_names=tab_names, analytics_enabled=False)
                 return block
@@ -122,92 +277,201 @@ class GUIGAGA:
         msg = "Could not create interface for command schema."
         raise ValueError(msg)
 
+    def create_lazy_tabs(self, schema: CommandSchema, subcommands: list[CommandSchema]):
+        """
+        Creates a tab for each subcommand, building the contents of a tab only when it is first selected.
+
+        Args:
+          schema (CommandSchema): The command group schema to create the tabs for.
+          subcommands (list[CommandSchema]): The subcommands to create a tab for.
+
+        Returns:
+          Blocks: The block containing the tabs.
+
+        Notes:
+          The first tab is visible on load so it is built immediately.
+        """
+        with gr.Blocks(theme=self.theme, analytics_enabled=False, title=self.app_name) as block:
+            if schema.name == "root":
+                gr.Markdown(f"""# {self.title}\n{schema.docstring}""")
+            self.render_lazy_tabs(subcommands)
+        return block
+
+    def render_lazy_tabs(self, subcommands: list[CommandSchema]):
+        """
+        Renders a tab for each subcommand into the current block, rendering all but the first tab when first selected.
+
+        Args:
+          subcommands (list[CommandSchema]): The subcommands to render a tab for.
+        """
+        with gr.Tabs():
+            for index, subcommand in enumerate(subcommands):
+                with gr.Tab(subcommand.name) as tab:
+                    if index == 0:
+                        self.render_subcommand(subcommand)
+                    else:
+                        self.render_on_select(tab, self.render_subcommand, subcommand)
+
+    def render_subcommand(self, subcommand: CommandSchema):
+        """
+        Renders the interface for the given subcommand into the current block.
+
+        Args:
+          subcommand (CommandSchema): The subcommand to render.
+
+        Notes:
+          This runs inside gr.render for every session, so it renders into plain containers rather than creating
+          new Blocks, which would each build their own app.
+        """
+        if not subcommand.subcommands:
+            with gr.Column():
+                self.render_command(subcommand)
+            return
+        subcommands = [nested for nested in subcommand.subcommands.values() if nested.name != self.command_name]
+        if len(subcommands) == 1:
+            self.render_subcommand(subcommands[0])
+        else:
+            self.render_lazy_tabs(subcommands)
+
+    def render_on_select(self, tab: gr.Tab, render_function: Callable, *args):
+        """
+        Renders the contents of the given tab the first time it is selected.
+
+        Args:
+          tab (gr.Tab): The tab to render the contents of.
+          render_function (Callable): The function that renders the contents of the tab.
+          *args: Arguments to pass to the render function.
+
+        Notes:
+          State change events only fire when the value changes, so the contents are only rendered once.
+        """
+        selected = gr.State(False)
+        tab.select(lambda: True, outputs=selected, queue=False)
+
+        @gr.render(triggers=[selected.change])
+        def render():
+            render_function(*args)
 
-    def create_block(self, command_schema: CommandSchema):
+    def render_file_explorer(self):
+        """
+        Renders a file explorer for choosing a file to download into the current block.
+
+        Side Effects:
+          - Creates the file explorer and download components.
+        """
+        file_explorer = gr.FileExplorer(
+            label="Choose a file to download",
+            file_count="single",
+            height=400,
+        )
+        output_file = gr.File(
+            label="Download file",
+            inputs=file_explorer,
+            visible=False,
+        )
+
+        def update(filename):
+            return gr.File(filename, visible=True)
+
+        file_explorer.change(update, file_explorer, output_file)
+
+    def create_block(self, command_schema: CommandSchema, title: str | None = None):
         """
         Creates a block for the given command schema.
 
         Args:
           command_schema (CommandSchema): The command schema to create a block for.
+          title (str | None): The heading to show instead of the command name. Defaults to None.
 
         Returns:
           tuple: The name of the command and the created block.
+        """
+        with Blocks(theme=self.theme, analytics_enabled=False, title=self.app_name) as block:
+            self.render_command(command_schema, title=title)
+        return command_schema.name, block
+
+    def render_command(self, command_schema: CommandSchema, title: str | None = None):
+        """
+        Renders the interface for the given command schema into the current block.
+
+        Args:
+          command_schema (CommandSchema): The command schema to render.
+          title (str | None): The heading to show instead of the command name. Defaults to None.
 
         Side Effects:
           - Creates various GUI components.
-          - Defines the run_command function.
+          - Defines the run_command async generator.
         """
-        logger = Logger()
-        with Blocks(theme=self.theme, analytics_enabled=False, title=self.app_name) as block:
-            self.render_help_and_header(command_schema)
-            with gr.Row():
-                with gr.Column():
-                    if self.hide_not_required:
-                        schemas = self.render_schemas(command_schema, render_not_required=False)
-                        if self.has_advanced_options(command_schema):
-                            with gr.Accordion("Advanced Options", open=False):
-                                schemas.update(self.render_schemas(command_schema, render_required=False))
-                    else:
-                        schemas = self.render_schemas(command_schema)
-                with gr.Column():
-                    btn = gr.Button("Run")
-                    with gr.Tab("Logs"):
-                        logs = gr.Textbox(show_label=False, lines=19, max_lines=19)
-                    with gr.Tab("Output", visible=False) as output_tab:
-                        outputs = self.get_outputs(command_schema)
-                    if self.allow_file_download:
-                        with gr.Tab("Files"):
-                            file_explorer = gr.FileExplorer(
-                                label="Choose a file to download",
-                                file_count="single",
-                                every=1,
-                                height=400,
-                            )
-                            output_file = gr.File(
-                                label="Download file",
-                                inputs=file_explorer,
-                                visible=False,
-                            )
-
-                            def update(filename):
-                                return gr.File(filename, visible=True)
-
-                            file_explorer.change(update, file_explorer, output_file)
-
-            # Define the run_command function as a generator
-            def run_command(*args, **kwargs):
-                # Start the logger's wrapped function which is a generator
-                def unwrap(function):
-                    if hasattr(function, "__wrapped__"):
-                        return unwrap(function.__wrapped__)
-                    return function
-                function = unwrap(command_schema.function)
-                log_gen = logger.intercept_stdin_stdout(
-                    function, self.click_context, catch_errors=self.catch_errors
-                )(*args, **kwargs)
-                logs_output = ""
-                # For each yielded log output
-                for log_chunk in log_gen:
-                    logs_output += log_chunk
-                    # Yield logs and no update for other outputs
-                    if self.allow_file_download:
-                        yield [logs_output, gr.Tab("Output", visible=False), None]
-                    else:
-                        yield [logs_output, gr.Tab("Output", visible=False)]
-                if logger.exit_code:
-                    if self.allow_file_download:
-                        return [logs_output, gr.Tab("Output", visible=False), None]
-                    return [logs_output, gr.Tab("Output", visible=False)]
-                # After function completes, yield final outputs
-                # Update output_group visibility and outputs
-                render_outputs = False
-                if outputs:
-                    render_outputs = True
-                yield [logs_output, gr.Tab("Output", visible=render_outputs), *self.get_output_values(command_schema)]
-
-            inputs = self.sort_schemas(command_schema, schemas)
-            btn.click(fn=run_command, inputs=inputs, outputs=[logs, output_tab, *outputs])
-        return command_schema.name, block
+        run_with_logs = self.logger.intercept_stdin_stdout(
+            command_schema.unwrapped_function,
+            self.click_context,
+            catch_errors=self.catch_errors,
+            poll_interval=self.stream_throttle_ms / 1000,
+        )
+        self.render_help_and_header(command_schema, title=title)
+        with gr.Row():
+            with gr.Column():
+                if self.hide_not_required:
+                    required, not_required = self.partition_schemas(command_schema)
+                    schemas = self.render_schemas(required)
+                    if not_required:
+                        with gr.Accordion("Advanced Options", open=False):
+                            advanced_schemas = self.render_schemas(not_required)
+                        schemas = {**schemas, **advanced_schemas}
+                else:
+                    schemas = self.render_schemas(command_schema.all_params)
+            with gr.Column():
+                btn = gr.Button("Run")
+                with gr.Tab("Logs"):
+                    logs = gr.Textbox(show_label=False, lines=19, max_lines=19)
+                with gr.Tab("Output", visible=False) as output_tab:
+                    outputs = self.get_outputs(command_schema)
+                if self.allow_file_download:
+                    with gr.Tab("Files"):
+                        self.render_file_explorer()
+
+        # Define the run_command function as an async generator so waiting for logs doesn't block the event loop
+        async def run_command(*args, **kwargs):
+            # Start the logger's wrapped function which is a generator
+            log_gen = run_with_logs(*args, **kwargs)
+            exit_code = None
+
+            def next_log_chunk():
+                nonlocal exit_code
+                try:
+                    return next(log_gen)
+                except StopIteration as stop:
+                    exit_code = stop.value
+                    return None
+
+            log_parts = []
+            # For each yielded log output, advancing the log generator in a worker thread.
+            # The logger yields new output at most once per poll interval, which throttles the GUI updates.
+            while True:
+                log_chunk = await asyncio.to_thread(next_log_chunk)
+                if log_chunk is None:
+                    break
+                if not log_chunk:
+                    continue
+                log_parts.append(log_chunk)
+                logs_output = "".join(log_parts)
+                # Yield logs and no update for other outputs
+                if self.allow_file_download:
+                    yield [logs_output, gr.Tab("Output", visible=False), None]
+                else:
+                    yield [logs_output, gr.Tab("Output", visible=False)]
+            logs_output = "".join(log_parts)
+            if exit_code:
+                return
+            # After function completes, yield final outputs
+            # Update output_group visibility and outputs
+            render_outputs = False
+            if outputs:
+                render_outputs = True
+            yield [logs_output, gr.Tab("Output", visible=render_outputs), *self.get_output_values(command_schema)]
+
+        inputs = self.sort_schemas(command_schema, schemas)
+        btn.click(fn=run_command, inputs=inputs, outputs=[logs, output_tab, *outputs])
 
     def get_outputs(self, command_schema: CommandSchema):
         """
@@ -219,11 +483,7 @@ class GUIGAGA:
         Returns:
           list: The list of outputs.
         """
-        outputs = []
-        for schema in command_schema.options + command_schema.arguments:
-            if isinstance(schema.type, OutputParamType):
-                outputs.append(schema.type.render(schema))
-        return outputs
+        return [schema.type.render(schema) for schema in command_schema.output_params]
 
     def get_output_values(self, command_schema: CommandSchema):
         """
@@ -235,23 +495,20 @@ class GUIGAGA:
         Returns:
           list: The list of output values.
         """
-        outputs = []
-        for schema in command_schema.options + command_schema.arguments:
-            if isinstance(schema.type, OutputParamType):
-                outputs.append(schema.type.value)
-        return outputs
+        return [schema.type.value for schema in command_schema.output_params]
 
-    def render_help_and_header(self, command_schema: CommandSchema):
+    def render_help_and_header(self, command_schema: CommandSchema, title: str | None = None):
         """
         Renders the help and header for the given command schema.
 
         Args:
           command_schema (CommandSchema): The command schema to render the help and header for.
+          title (str | None): The heading to show instead of the command name. Defaults to None.
 
         Side Effects:
           - Renders the help and header.
         """
-        gr.Markdown(f"""# {command_schema.name}""")
+        gr.Markdown(f"""# {title or command_schema.name}""")
         gr.Markdown(command_schema.docstring)
 
     def has_advanced_options(self, command_schema: CommandSchema):
@@ -264,34 +521,36 @@ class GUIGAGA:
         Returns:
           bool: True if the command schema has advanced options, False otherwise.
         """
-        return any(not schema.required for schema in command_schema.options + command_schema.arguments)
+        return any(not schema.required for schema in command_schema.all_params)
+
+    def partition_schemas(self, command_schema: CommandSchema):
+        """
+        Splits the schemas of the given command schema into required and not required schemas.
+
+        Args:
+          command_schema (CommandSchema): The command schema to partition the schemas of.
 
-    def render_schemas(self, command_schema, *, render_required=True, render_not_required=True):
+        Returns:
+          tuple[list, list]: The required schemas and the not required schemas.
         """
-        Renders the schemas for the given command schema.
+        required, not_required = [], []
+        for schema in command_schema.all_params:
+            (required if schema.required else not_required).append(schema)
+        return required, not_required
+
+    def render_schemas(self, schemas):
+        """
+        Renders the given schemas.
 
         Args:
-          command_schema (CommandSchema): The command schema to render the schemas for.
-          render_required (bool): Whether to render required schemas. Defaults to True.
-          render_not_required (bool): Whether to render not required schemas. Defaults to True.
+          schemas (Iterable[OptionSchema | ArgumentSchema]): The schemas to render.
 
         Returns:
           dict: The rendered schemas.
         """
-        inputs = {}
-        schemas = command_schema.arguments + command_schema.options  #TODO: sort the schemas before passing them to the render function
-        schemas = [
-            schema
-            for schema in schemas
-            if (render_required and schema.required) or (render_not_required and not schema.required)
-        ]
-        schemas_name_map = {
-            schema.name if isinstance(schema.name, str) else schema.name[0].lstrip("-").replace("-", "_"): schema for schema in schemas
-        }
-        for name, schema in schemas_name_map.items():
-            component = self.get_component(schema)
-            inputs[name] = component
-        return inputs
+        #TODO: sort the schemas before passing them to the render function
+        schemas_name_map = {schema.param_name: schema for schema in schemas}
+        return {name: self.get_component(schema) for name, schema in schemas_name_map.items()}
 
     def sort_schemas(self, command_schema, schemas: dict):
         """
@@ -304,15 +563,7 @@ class GUIGAGA:
         Returns:
           list: The sorted schemas.
         """
-        # recursively unwrap the function
-        def unwrap(function):
-            if hasattr(function, "__wrapped__"):
-                return unwrap(function.__wrapped__)
-            return function
-        function = unwrap(command_schema.function)
-        order = function.__code__.co_varnames[: function.__code__.co_argcount]
-        schemas = [schemas[name] for name in order if name in schemas]
-        return schemas
+        return [schemas[name] for name in command_schema.param_order if name in schemas]
 
     def get_component(self, schema: OptionSchema | ArgumentSchema):
         """
@@ -328,61 +579,13 @@ class GUIGAGA:
         default = None
         if schema.default.values:
             default = schema.default.values[0][0]
-        if isinstance(schema, OptionSchema):
-            label = schema.name[0].lstrip("-")
-            help_text = schema.help
-        else:
-            label = schema.name
-            help_text = None
+        label = schema.label
+        help_text = schema.help if isinstance(schema, OptionSchema) else None
         # Handle different component types
-        if isinstance(schema.type, OutputParamType):
+        if schema.is_output:
             return gr.Textbox(value=schema.type.value, visible=False)
-        if isinstance(schema.type, InputParamType):
+        if schema.is_input:
             return schema.type.render(schema)
         # Defaults will be moved into Types
-        component_type_name = schema.type.name
-        if component_type_name == "text":
-            return gr.Textbox(label=label, value=default, info=help_text)
-
-        elif component_type_name == "integer":
-            return gr.Number(default, label=label, precision=0, info=help_text)
-
-        elif component_type_name == "float":
-            return gr.Number(default, label=label, info=help_text)
-
-        elif component_type_name == "boolean":
-            return gr.Checkbox(default == "true", label=label, info=help_text)
-
-        elif component_type_name == "uuid":
-            uuid_val = str(uuid.uuid4()) if default is None else default
-            return gr.Textbox(uuid_val, label=label, info=help_text)
-
-        elif component_type_name == "filename":
-            return gr.File(label=label, value=default)
-
-        elif component_type_name == "path":
-            return gr.File(label=label, value=default)
-
-        elif component_type_name == "choice":
-            choices = schema.type.choices
-            return gr.Dropdown(choices, value=default, label=label, info=help_text)
-
-        elif component_type_name == "integer range":
-            min_val = schema.type.min if schema.type.min is not None else 0
-            max_val = schema.type.max if schema.type.max is not None else 100
-            return gr.Slider(minimum=min_val, maximum=max_val, step=1, value=default, label=label, info=help_text)
-
-        elif component_type_name == "float range":
-            min_val = schema.type.min if schema.type.min is not None else 0.0
-            max_val = schema.type.max if schema.type.max is not None else 1.0
-            return gr.Slider(minimum=min_val, maximum=max_val, value=default, label=label, step=0.01, info=help_text)
-
-        elif component_type_name == "datetime":
-            formats = (
-                schema.type.formats if schema.type.formats else ["%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S"]
-            )
-            datetime_val = default if default is not None else datetime.now().strftime(formats[0])  # noqa: DTZ005
-            return gr.DateTime(value=datetime_val, label=label, info=help_text)
-
-        else:
-            return gr.Textbox(value=default, label=label, info=help_text)
+        build_component = self._BUILDERS.get(schema.type.name, _build_text)
+        return build_component(schema, label, default, help_text)
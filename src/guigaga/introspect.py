@@ -1,8 +1,10 @@
 # from https://github.com/Textualize/trogon
 from __future__ import annotations
 
+import inspect
 import uuid
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any, Callable, NewType, Sequence
 
 import click
@@ -63,8 +65,38 @@ class MultiValueParamData:
         return value
 
 
+class ParamSchema:
+    """
+    A mixin for the option and argument schemas that classifies their parameter type once.
+    """
+
+    @cached_property
+    def is_output(self) -> bool:
+        """
+        Checks whether the parameter has an output parameter type.
+
+        Returns:
+          bool: True if the parameter type is an OutputParamType.
+        """
+        from guigaga.types import OutputParamType
+
+        return isinstance(self.type, OutputParamType)
+
+    @cached_property
+    def is_input(self) -> bool:
+        """
+        Checks whether the parameter has an input parameter type.
+
+        Returns:
+          bool: True if the parameter type is an InputParamType.
+        """
+        from guigaga.types import InputParamType
+
+        return isinstance(self.type, InputParamType)
+
+
 @dataclass
-class OptionSchema:
+class OptionSchema(ParamSchema):
     """
     A data class for defining the schema of a CLI option.
 
@@ -109,9 +141,29 @@ class OptionSchema:
         """
         self.multi_value = isinstance(self.type, click.Tuple)
 
+    @cached_property
+    def label(self) -> str:
+        """
+        Gets the label of the option, its first name without the leading dashes.
+
+        Returns:
+          str: The label of the option.
+        """
+        return self.name[0].lstrip("-")
+
+    @cached_property
+    def param_name(self) -> str:
+        """
+        Gets the name of the option as a Python identifier.
+
+        Returns:
+          str: The label of the option with dashes replaced by underscores.
+        """
+        return self.label.replace("-", "_")
+
 
 @dataclass
-class ArgumentSchema:
+class ArgumentSchema(ParamSchema):
     """
     A data class for defining the schema of a CLI argument.
 
@@ -134,6 +186,26 @@ class ArgumentSchema:
     multiple: bool = False
     nargs: int = 1
 
+    @property
+    def label(self) -> str:
+        """
+        Gets the label of the argument.
+
+        Returns:
+          str: The name of the argument.
+        """
+        return self.name
+
+    @property
+    def param_name(self) -> str:
+        """
+        Gets the name of the argument as a Python identifier.
+
+        Returns:
+          str: The name of the argument.
+        """
+        return self.name
+
 
 @dataclass
 class CommandSchema:
@@ -178,6 +250,47 @@ class CommandSchema:
             path.append(node)
         return list(reversed(path))
 
+    @cached_property
+    def unwrapped_function(self) -> Callable[..., Any | None]:
+        """
+        Gets the innermost function of the command, following any `__wrapped__` chain left by decorators.
+
+        Returns:
+          Callable[..., Any | None]: The unwrapped command function.
+        """
+        return inspect.unwrap(self.function)
+
+    @cached_property
+    def param_order(self) -> tuple[str, ...]:
+        """
+        Gets the names of the command function's arguments in the order they are declared.
+
+        Returns:
+          tuple[str, ...]: The argument names of the unwrapped command function.
+        """
+        code = self.unwrapped_function.__code__
+        return code.co_varnames[: code.co_argcount]
+
+    @cached_property
+    def all_params(self) -> tuple[ArgumentSchema | OptionSchema, ...]:
+        """
+        Gets all the arguments and options of the command, arguments first.
+
+        Returns:
+          tuple[ArgumentSchema | OptionSchema, ...]: The arguments followed by the options of the command.
+        """
+        return (*self.arguments, *self.options)
+
+    @cached_property
+    def output_params(self) -> tuple[ArgumentSchema | OptionSchema, ...]:
+        """
+        Gets the arguments and options of the command that have an output parameter type.
+
+        Returns:
+          tuple[ArgumentSchema | OptionSchema, ...]: The output arguments and options of the command.
+        """
+        return tuple(param for param in self.all_params if param.is_output)
+
 
 def introspect_click_app(app: BaseCommand) -> dict[CommandName, CommandSchema]:
     """
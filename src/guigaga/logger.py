@@ -109,17 +109,15 @@ class Logger:
 
     Attributes:
       process: The process that the logger is logging for.
-      exit_code: The exit code of the process.
     """
     def __init__(self):
         """
         Initializes a new instance of the Logger class.
 
         Side Effects:
-          Initializes the process and exit_code attributes to None.
+          Initializes the process attribute to None.
         """
         self.process = None
-        self.exit_code = None
 
     def log(self, message: str, level: str = "INFO"):
         """
@@ -148,10 +146,21 @@ class Logger:
         except queue.Empty:
             pass
 
-    def intercept_stdin_stdout(self, fn: Callable, ctx, *, catch_errors) -> Callable:
-        """Wrap a function to intercept and yield stdout and stderr using threading."""
+    def intercept_stdin_stdout(self, fn: Callable, ctx, *, catch_errors, poll_interval: float = 0.1) -> Callable:
+        """
+        Wrap a function to intercept and yield stdout and stderr using threading.
+
+        The wrapped function is a generator that yields only the log text added since its previous yield, so
+        joining everything it yields gives the full log. It returns the exit code of the call when exhausted.
 
-        def wrapped(*args, **kwargs) -> str:
+        Args:
+          fn (Callable): The function to wrap.
+          ctx: The click context to run the function in.
+          catch_errors (bool): Whether to log errors instead of raising them.
+          poll_interval (float, optional): Seconds between checks for new output. Defaults to 0.1.
+        """
+
+        def wrapped(*args, **kwargs) -> Generator[str, None, int]:
             # Pass the context to wrap_for_process
             stdout_queue, stderr_queue, error_queue, wrapped_fn = wrap_for_process(fn, ctx)
             thread = threading.Thread(target=wrapped_fn, args=args, kwargs=kwargs)
@@ -161,13 +170,25 @@ class Logger:
 
             # Collect logs while the thread is running
             logs = []
+            sent = 0
+
+            def new_logs() -> str:
+                # The lines logged since the last yield, separated from the previous ones by a newline
+                nonlocal sent
+                chunk = "\n".join(logs[sent:])
+                if sent and len(logs) > sent:
+                    chunk = "\n" + chunk
+                sent = len(logs)
+                return chunk
+
             while thread.is_alive():
                 logs.extend(self._log_from_queue(stdout_queue))
                 logs.extend(self._log_from_queue(stderr_queue))
-                thread.join(timeout=0.1)
+                thread.join(timeout=poll_interval)
 
-                # Yield logs
-                yield "\n".join(logs)
+                # Yield new logs
+                if len(logs) > sent:
+                    yield new_logs()
 
             # After the thread completes, yield any remaining logs
             logs.extend(self._log_from_queue(stdout_queue))
@@ -176,15 +197,17 @@ class Logger:
             # Check for errors
             try:
                 error_msg = error_queue.get_nowait()
-                self.exit_code = 1
+                exit_code = 1
                 if catch_errors:
                     logs.append(f"ERROR: {error_msg}")
                 else:
                     raise Exception(error_msg)
             except queue.Empty:
-                self.exit_code = 0
+                exit_code = 0
 
-            # Return all logs as a string
-            yield "\n".join(logs)
+            # Yield the remaining logs
+            yield new_logs()
+            # Return the exit code per call rather than storing it, as the logger is shared by concurrent calls
+            return exit_code
 
         return wrapped
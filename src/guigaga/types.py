@@ -1,5 +1,4 @@
 import pathlib
-import tempfile
 from abc import ABC, abstractmethod
 
 from click import ParamType as ClickParamType
@@ -70,16 +69,13 @@ class FilePath(File):
         """
         file_name = f.path
         if self.type == "filepath":
-            file = tempfile.NamedTemporaryFile(delete=False, dir=self.GRADIO_CACHE)
-            file.name = file_name
             return pathlib.Path(file_name)
         elif self.type == "binary":
-            with open(file_name, "rb") as file_data:
-                return file_data.read()
+            return pathlib.Path(file_name).read_bytes()
         else:
             raise ValueError(
                 "Unknown type: "
-                + str(type)
+                + str(self.type)
                 + ". Please choose from: 'filepath', 'binary'."
             )
 